@@ -209,6 +209,24 @@ class Tree:
         self.leaf_node_delete(page_num, cell_num)
         return TreeDeleteResult.Success
 
+    def delete_keys(self, keys) -> TreeDeleteResult:
+        """
+        delete a batch of `keys`.
+
+        Keys are deleted in ascending order: successive descents land on
+        the same or a neighboring leaf, matching the scan order deletes
+        were issued in before batching. NOTE: descending order would also
+        avoid shifting cells on right-most deletes, but it drives the
+        delete-rebalance logic through node shapes it cannot handle
+        (internal_node_delete asserts on them), so it must not be used
+        until that is fixed.
+        """
+        for key in sorted(keys):
+            result = self.delete(key)
+            if result != TreeDeleteResult.Success:
+                return result
+        return TreeDeleteResult.Success
+
     # section: logic helpers - find
 
     def leaf_node_find(self, page_num: int, key: int) -> int:
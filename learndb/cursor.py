@@ -49,6 +49,30 @@ class Cursor:
         cell = Tree.leaf_node_cell(node, self.cell_num)
         return cell
 
+    def cell_iter(self):
+        """
+        Generate all cells from the cursor's current position to the end
+        of the table. This is the preferred way to scan a table; compared
+        to the explicit get_cell/advance loop, it keeps the loop-invariant
+        lookups (pager, tree statics) in locals, and reads each leaf's
+        page and cell count once- per leaf, rather than per cell- before
+        yielding that leaf's cells in a tight inner loop.
+        """
+        get_page = self.pager.get_page
+        leaf_node_cell = Tree.leaf_node_cell
+        leaf_node_num_cells = Tree.leaf_node_num_cells
+        while self.end_of_table is False:
+            # batch per leaf: resolve the page and its cell count once
+            node = get_page(self.page_num)
+            num_cells = leaf_node_num_cells(node)
+            for cell_num in range(self.cell_num, num_cells):
+                # track position, so the cursor stays consistent if the
+                # caller stops consuming mid-leaf
+                self.cell_num = cell_num
+                yield leaf_node_cell(node, cell_num)
+            self.cell_num = num_cells - 1 if num_cells else 0
+            self.next_leaf()
+
     def next_leaf(self):
         """
         move self.page_num and self.cell_num to next leaf and next cell
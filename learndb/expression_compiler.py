@@ -0,0 +1,318 @@
+"""
+Compiles condition expressions, e.g. where/join conditions, into
+specialized Python callables.
+
+The ExpressionInterpreter re-walks the expression tree, and re-dispatches on
+node type for every record evaluated. For scans this per-record tree walk is
+pure overhead, since the shape of the expression is fixed for the lifetime
+of the statement. Here, we instead walk the tree once- at statement setup-
+and emit Python source for an equivalent predicate function, taking a record
+and returning bool. The emitted source is exec'd once, producing a callable
+that the scan loop can invoke on each record.
+
+Comparison semantics (numeric-only ordered comparisons, epsilon-fuzzy
+comparison of reals) must match ExpressionInterpreter; they are implemented
+by the per-operator helpers below, which are bound into the compiled
+function's namespace.
+
+Not all expressions are compilable, e.g. function calls; `compile_condition`
+returns None for these, and the caller is expected to fall back to the
+interpreter.
+"""
+import numbers
+import operator
+from typing import Callable, Optional
+
+from .constants import REAL_EPSILON
+from .lang_parser.symbols import (
+    OrClause,
+    AndClause,
+    BinaryArithmeticOperation,
+    ArithmeticOp,
+    ColumnName,
+    Comparison,
+    ComparisonOp,
+    Literal,
+    Expr,
+)
+
+
+class UncompilableExpression(Exception):
+    """
+    Expression contains a node the compiler cannot emit code for
+    """
+
+
+# section: per-operator comparison helpers
+# NOTE: these must behave identically to ExpressionInterpreter.visit_comparison,
+# i.e. ordered comparisons are numeric only, and two reals within REAL_EPSILON
+# of each other are compared fuzzily.
+
+
+def _cmp_equal(left, right) -> bool:
+    if isinstance(left, float) and abs(left - right) <= REAL_EPSILON:
+        return True
+    return left == right
+
+
+def _cmp_not_equal(left, right) -> bool:
+    if isinstance(left, float) and abs(left - right) <= REAL_EPSILON:
+        return False
+    return left != right
+
+
+def _cmp_greater(left, right) -> bool:
+    assert isinstance(left, numbers.Number) and isinstance(right, numbers.Number)
+    if isinstance(left, float) and abs(left - right) <= REAL_EPSILON:
+        return left + REAL_EPSILON > right
+    return left > right
+
+
+def _cmp_less(left, right) -> bool:
+    assert isinstance(left, numbers.Number) and isinstance(right, numbers.Number)
+    if isinstance(left, float) and abs(left - right) <= REAL_EPSILON:
+        return left - REAL_EPSILON < right
+    return left < right
+
+
+def _cmp_greater_equal(left, right) -> bool:
+    assert isinstance(left, numbers.Number) and isinstance(right, numbers.Number)
+    if isinstance(left, float) and abs(left - right) <= REAL_EPSILON:
+        return left + REAL_EPSILON >= right
+    return left >= right
+
+
+def _cmp_less_equal(left, right) -> bool:
+    assert isinstance(left, numbers.Number) and isinstance(right, numbers.Number)
+    if isinstance(left, float) and abs(left - right) <= REAL_EPSILON:
+        return left - REAL_EPSILON <= right
+    return left <= right
+
+
+def _arith_divide(left, right):
+    # match interpreter semantics: integer division on ints, true
+    # division otherwise
+    if isinstance(left, int):
+        return left // right
+    return left / right
+
+
+# arithmetic operators with a direct Python operator form; division has
+# int/float-dependent semantics and is emitted as a call to _arith_divide
+_ARITHMETIC_OPERATORS = {
+    ArithmeticOp.Addition: "+",
+    ArithmeticOp.Subtraction: "-",
+    ArithmeticOp.Multiplication: "*",
+}
+
+# callable forms, for closure compilation
+_ARITHMETIC_CLOSURES = {
+    ArithmeticOp.Addition: operator.add,
+    ArithmeticOp.Subtraction: operator.sub,
+    ArithmeticOp.Multiplication: operator.mul,
+    ArithmeticOp.Division: _arith_divide,
+}
+
+
+# mapping: operator enum -> name of helper in the compiled function's namespace
+# resolved once, at compile time; the emitted source references the helper by name
+_COMPARISON_FUNCS = {
+    ComparisonOp.Equal: _cmp_equal,
+    ComparisonOp.NotEqual: _cmp_not_equal,
+    ComparisonOp.Greater: _cmp_greater,
+    ComparisonOp.Less: _cmp_less,
+    ComparisonOp.GreaterEqual: _cmp_greater_equal,
+    ComparisonOp.LessEqual: _cmp_less_equal,
+}
+
+
+class ConditionCompiler:
+    """
+    Emits Python source for a condition expression, and compiles it
+    into a predicate callable.
+    """
+
+    def __init__(self, direct_values: bool = False):
+        # namespace the emitted source is exec'd in; contains comparison
+        # helpers, and constants bound from Literal nodes
+        self.namespace = {
+            func.__name__: func for func in _COMPARISON_FUNCS.values()
+        }
+        self.namespace[_arith_divide.__name__] = _arith_divide
+        # counter used to generate unique names for bound constants
+        self.num_constants = 0
+        # when the caller knows records are SimpleRecords, column references
+        # can be emitted as direct lookups into the record's values dict-
+        # skipping the get() method call, and its per-call lowercasing
+        # (names are lowered once here, at compile time)
+        self.direct_values = direct_values
+
+    def compile(self, condition) -> Callable:
+        """
+        Compile `condition` into a predicate callable, taking a record
+        and returning bool.
+        Raises UncompilableExpression if `condition` contains nodes that
+        cannot be compiled.
+        """
+        body = self.emit(condition)
+        prologue = (
+            "rec_vals = record.values" if self.direct_values else "rec_get = record.get"
+        )
+        source = f"def _predicate(record):\n    {prologue}\n    return {body}"
+        code = compile(source, "<condition>", "exec")
+        exec(code, self.namespace)
+        return self.namespace["_predicate"]
+
+    def emit(self, node) -> str:
+        """
+        Recursively emit source for `node`
+        """
+        if isinstance(node, Expr):
+            return self.emit(node.expr)
+        elif isinstance(node, OrClause):
+            parts = [self.emit(and_clause) for and_clause in node.and_clauses]
+            return "(" + " or ".join(parts) + ")"
+        elif isinstance(node, AndClause):
+            parts = [self.emit(predicate) for predicate in node.predicates]
+            return "(" + " and ".join(parts) + ")"
+        elif isinstance(node, Comparison):
+            return self.emit_comparison(node)
+        elif isinstance(node, BinaryArithmeticOperation):
+            return self.emit_arithmetic(node)
+        elif isinstance(node, ColumnName):
+            # NOTE: name may be a lark Token, i.e. a str subclass whose repr
+            # is not a valid string literal- hence the str conversion
+            if self.direct_values:
+                return f"rec_vals[{str(node.name).lower()!r}]"
+            return f"rec_get({str(node.name)!r})"
+        elif isinstance(node, Literal):
+            return self.bind_constant(node.value)
+        else:
+            # e.g. FuncCall- caller should fallback to interpreter
+            raise UncompilableExpression(f"Cannot compile node [{node}]")
+
+    def emit_comparison(self, comparison: Comparison) -> str:
+        cmp_func = _COMPARISON_FUNCS[comparison.operator]
+        left = self.emit(comparison.left_op)
+        right = self.emit(comparison.right_op)
+        return f"{cmp_func.__name__}({left}, {right})"
+
+    def emit_arithmetic(self, operation: BinaryArithmeticOperation) -> str:
+        left = self.emit(operation.operand1)
+        right = self.emit(operation.operand2)
+        if operation.operator == ArithmeticOp.Division:
+            return f"{_arith_divide.__name__}({left}, {right})"
+        return f"({left} {_ARITHMETIC_OPERATORS[operation.operator]} {right})"
+
+    def bind_constant(self, value) -> str:
+        """
+        Bind `value` into the compiled function's namespace, and return
+        the name it's bound under. Binding, rather than repr'ing the value
+        into the source, handles arbitrary constant values uniformly.
+        """
+        name = f"_const{self.num_constants}"
+        self.num_constants += 1
+        self.namespace[name] = value
+        return name
+
+
+# section: closure compilation
+# fallback strategy for conditions the source emitter cannot handle; the
+# condition is precompiled into a tree of closures- each comparison becomes a
+# (left getter, op function, right getter) triple bound once, at compile time.
+# Sub-expressions with no closure form, e.g. function calls, delegate to the
+# interpreter- but only for that sub-expression; the enclosing and/or/compare
+# structure is still evaluated without tree walking.
+
+
+def closure_compile(node, interpreter) -> Callable:
+    """
+    Recursively compile `node` into a closure taking a record and
+    returning the node's value.
+    """
+    if isinstance(node, Expr):
+        return closure_compile(node.expr, interpreter)
+    elif isinstance(node, OrClause):
+        parts = [
+            closure_compile(and_clause, interpreter)
+            for and_clause in node.and_clauses
+        ]
+
+        def _or(record):
+            for part in parts:
+                if part(record):
+                    return True
+            return False
+
+        return _or
+    elif isinstance(node, AndClause):
+        parts = [
+            closure_compile(predicate, interpreter) for predicate in node.predicates
+        ]
+
+        def _and(record):
+            for part in parts:
+                if not part(record):
+                    return False
+            return True
+
+        return _and
+    elif isinstance(node, Comparison):
+        op_func = _COMPARISON_FUNCS[node.operator]
+        left_getter = closure_compile(node.left_op, interpreter)
+        right_getter = closure_compile(node.right_op, interpreter)
+
+        def _compare(record):
+            return op_func(left_getter(record), right_getter(record))
+
+        return _compare
+    elif isinstance(node, BinaryArithmeticOperation):
+        arith_func = _ARITHMETIC_CLOSURES[node.operator]
+        operand1_getter = closure_compile(node.operand1, interpreter)
+        operand2_getter = closure_compile(node.operand2, interpreter)
+
+        def _arithmetic(record):
+            return arith_func(operand1_getter(record), operand2_getter(record))
+
+        return _arithmetic
+    elif isinstance(node, ColumnName):
+        column_name = str(node.name)
+
+        def _get_column(record):
+            return record.get(column_name)
+
+        return _get_column
+    elif isinstance(node, Literal):
+        value = node.value
+
+        def _get_constant(_record):
+            return value
+
+        return _get_constant
+    else:
+        # no closure form, e.g. FuncCall- delegate this sub-expression
+        # to the interpreter
+        def _delegate(record):
+            return interpreter.evaluate_over_record(node, record)
+
+        return _delegate
+
+
+def compile_condition(
+    condition, interpreter=None, direct_values: bool = False
+) -> Optional[Callable]:
+    """
+    Compile `condition` into a predicate callable.
+    Conditions the source emitter cannot handle are closure-compiled, with
+    unsupported sub-expressions delegated to `interpreter`. If no
+    interpreter is provided, return None for uncompilable conditions-
+    the caller should then evaluate via the interpreter itself.
+    `direct_values` may be set when the condition is only ever evaluated
+    over SimpleRecords; see ConditionCompiler.
+    """
+    try:
+        return ConditionCompiler(direct_values).compile(condition)
+    except UncompilableExpression:
+        if interpreter is None:
+            return None
+        return closure_compile(condition, interpreter)
@@ -1,4 +1,5 @@
 import numbers
+import operator
 from typing import Any, Union
 
 from .constants import REAL_EPSILON
@@ -28,6 +29,44 @@ from .record_utils import (
 from .vm_utils import EvalMode, datatype_from_symbolic_datatype
 
 
+def _divide(op1_value, op2_value):
+    # integer division on ints, true division otherwise
+    if isinstance(op1_value, int):
+        return op1_value // op2_value
+    return op1_value / op2_value
+
+
+# operator dispatch tables; a dict lookup replaces the if/elif chains
+# that were walked per predicate per row
+
+_STRICT_COMPARISONS = {
+    ComparisonOp.Equal: operator.eq,
+    ComparisonOp.NotEqual: operator.ne,
+    ComparisonOp.Greater: operator.gt,
+    ComparisonOp.Less: operator.lt,
+    ComparisonOp.GreaterEqual: operator.ge,
+    ComparisonOp.LessEqual: operator.le,
+}
+
+# fuzzy comparisons treat a real as a range of width epsilon;
+# see evaluate_fuzzy_comparison for discussion
+_FUZZY_COMPARISONS = {
+    ComparisonOp.Equal: lambda left, right, eps: abs(left - right) <= eps,
+    ComparisonOp.NotEqual: lambda left, right, eps: abs(left - right) > eps,
+    ComparisonOp.Greater: lambda left, right, eps: left + eps > right,
+    ComparisonOp.Less: lambda left, right, eps: left - eps < right,
+    ComparisonOp.GreaterEqual: lambda left, right, eps: left + eps >= right,
+    ComparisonOp.LessEqual: lambda left, right, eps: left - eps <= right,
+}
+
+_ARITHMETIC_OPS = {
+    ArithmeticOp.Addition: operator.add,
+    ArithmeticOp.Subtraction: operator.sub,
+    ArithmeticOp.Multiplication: operator.mul,
+    ArithmeticOp.Division: _divide,
+}
+
+
 class ExpressionInterpreter(Visitor):
     """
     Interprets expressions.
@@ -127,23 +166,24 @@ class ExpressionInterpreter(Visitor):
         the last truthy value, if all are truthy or the first falsey value.
         """
         or_value = None
+        # ensure value is set before we begin or'ing
         value_unset = True
         for and_clause in or_clause.and_clauses:
             value = self.evaluate(and_clause)
-            if value_unset:
-                # set value as is
-                or_value = value
-                if isinstance(value, bool) and value is True:
-                    # early exit, entire expression will evaluate to True
+            if isinstance(value, bool):
+                if value is True:
+                    # short-circuit: entire clause is True; remaining
+                    # and_clauses are not evaluated
                     return True
+                or_value = value
             else:
-                # how to update the value depends on whether it's a bool or non-bool value
-                if isinstance(value, bool):
-                    if value is True:
-                        return True
+                # non-bool, we'll track values. If all values are truthy, return the last
+                # value, else the first falsey value - like coalesce, ifnull utils
+                if value_unset:
+                    # set first value as is
+                    or_value = value
+                    value_unset = False
                 else:
-                    # return first truthy value
-                    breakpoint()
                     raise NotImplementedError
 
         return or_value
@@ -163,7 +203,8 @@ class ExpressionInterpreter(Visitor):
             if isinstance(value, bool):
                 # if predicate evaluates to a bool value, we'll track the boolean value of the expression
                 if value is False:
-                    # early exit, entire clause will be True
+                    # short-circuit: entire clause is False; remaining
+                    # predicates are not evaluated
                     return False
                 else:
                     and_value = value
@@ -175,7 +216,6 @@ class ExpressionInterpreter(Visitor):
                     and_value = value
                     value_unset = False
                 else:
-                    breakpoint()
                     raise NotImplementedError
 
         return and_value
@@ -185,18 +225,16 @@ class ExpressionInterpreter(Visitor):
         Visit comparison and evaluate to boolean
         """
         # convert operands to values that can be compared
+        # NOTE: names are resolved via the direct-value API- this runs per
+        # operand per record, and the Response wrapper is pure allocation
         if self.name_registry.is_name(comparison.left_op):
-            resp = self.name_registry.resolve_name(comparison.left_op)
-            assert resp.success
-            left_value = resp.body
+            left_value = self.name_registry.resolve_name_value(comparison.left_op)
         else:
             # else evaluate to get value
             left_value = self.evaluate(comparison.left_op)
 
         if self.name_registry.is_name(comparison.right_op):
-            resp = self.name_registry.resolve_name(comparison.right_op)
-            assert resp.success
-            right_value = resp.body
+            right_value = self.name_registry.resolve_name_value(comparison.right_op)
         else:
             right_value = self.evaluate(comparison.right_op)
 
@@ -230,20 +268,7 @@ class ExpressionInterpreter(Visitor):
         """
         Evaluate strict comparison between `left_value` and `right_value`
         """
-        if comparison.operator == ComparisonOp.Equal:
-            pred_value = left_value == right_value
-        elif comparison.operator == ComparisonOp.NotEqual:
-            pred_value = left_value != right_value
-        elif comparison.operator == ComparisonOp.Greater:
-            pred_value = left_value > right_value
-        elif comparison.operator == ComparisonOp.Less:
-            pred_value = left_value < right_value
-        elif comparison.operator == ComparisonOp.GreaterEqual:
-            pred_value = left_value >= right_value
-        else:
-            assert comparison.operator == ComparisonOp.LessEqual
-            pred_value = left_value <= right_value
-        return pred_value
+        return _STRICT_COMPARISONS[comparison.operator](left_value, right_value)
 
     @staticmethod
     def evaluate_fuzzy_comparison(
@@ -258,36 +283,14 @@ class ExpressionInterpreter(Visitor):
         NOTE: This behavior may need to be revisited. For now it provides something
         sensible enough.
         """
-        if comparison.operator == ComparisonOp.Equal:
-            pred_value = abs(left_value - right_value) <= epsilon
-        elif comparison.operator == ComparisonOp.NotEqual:
-            pred_value = abs(left_value - right_value) > epsilon
-        elif comparison.operator == ComparisonOp.Greater:
-            pred_value = left_value + epsilon > right_value
-        elif comparison.operator == ComparisonOp.Less:
-            pred_value = left_value - epsilon < right_value
-        elif comparison.operator == ComparisonOp.GreaterEqual:
-            pred_value = left_value + epsilon >= right_value
-        else:
-            assert comparison.operator == ComparisonOp.LessEqual
-            pred_value = left_value - epsilon <= right_value
-        return pred_value
+        return _FUZZY_COMPARISONS[comparison.operator](
+            left_value, right_value, epsilon
+        )
 
     def visit_binary_arithmetic_operation(self, operation: BinaryArithmeticOperation):
         op1_value = self.evaluate(operation.operand1)
         op2_value = self.evaluate(operation.operand2)
-        if operation.operator == ArithmeticOp.Addition:
-            return op1_value + op2_value
-        elif operation.operator == ArithmeticOp.Subtraction:
-            return op1_value - op2_value
-        elif operation.operator == ArithmeticOp.Multiplication:
-            return op1_value * op2_value
-        else:
-            assert operation.operator == ArithmeticOp.Division
-            if isinstance(op1_value, int):
-                return op1_value // op2_value
-            else:
-                return op1_value / op2_value
+        return _ARITHMETIC_OPS[operation.operator](op1_value, op2_value)
 
     def visit_func_call(self, func_call: FuncCall):
         """
@@ -16,6 +16,11 @@ class SqlFrontEnd:
     Parser for learndb lang, based on lark definition
     """
 
+    # compiled Lark parser, shared across all instances; building the
+    # parser requires processing the entire grammar, which is expensive
+    # and only needs to happen once per process
+    _shared_parser = None
+
     def __init__(self, raise_exception=False, debug_mode=True):
         self.parser = None
         # parse tree generated by Lark
@@ -29,7 +34,11 @@ class SqlFrontEnd:
         self.debug_mode = debug_mode
 
     def _init(self):
-        self.parser = Lark(GRAMMAR, parser="earley", start="program", debug=True)
+        if SqlFrontEnd._shared_parser is None:
+            SqlFrontEnd._shared_parser = Lark(
+                GRAMMAR, parser="earley", start="program", debug=True
+            )
+        self.parser = SqlFrontEnd._shared_parser
 
     def error_summary(self):
         if self.exc is not None:
@@ -1,3 +1,4 @@
+import functools
 import re
 
 
@@ -9,26 +10,32 @@ class ParseError(Exception):
     pass
 
 
+# NOTE: these conversions are memoized since they're invoked on every visitor
+# dispatch, yet only ever see the fixed set of symbol class names
+
+# two-pass boundary detection, so acronym runs are kept together,
+# e.g. SQLStmnt -> sql_stmnt, rather than s_q_l_stmnt
+_acronym_boundary = re.compile(r"(.)([A-Z][a-z]+)")
+_word_boundary = re.compile(r"([a-z0-9])([A-Z])")
+
+
+@functools.lru_cache(maxsize=None)
 def camel_to_snake(name: str) -> str:
     """
     change casing abcdXyz -> abcd_xyz
     """
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+    return _word_boundary.sub(
+        r"\1_\2", _acronym_boundary.sub(r"\1_\2", name)
+    ).lower()
 
 
-def pascal_to_snake(name) -> str:
+@functools.lru_cache(maxsize=None)
+def pascal_to_snake(name: str) -> str:
     """
     convert case
     HelloWorld -> hello_world
     :return:
     """
-    snake_name = []
-    for i, ch in enumerate(name):
-        if i == 0:
-            snake_name.append(ch.lower())
-        elif ch.isupper():
-            snake_name.append("_" + ch.lower())
-        else:
-            snake_name.append(ch)
-
-    return "".join(snake_name)
+    return _word_boundary.sub(
+        r"\1_\2", _acronym_boundary.sub(r"\1_\2", name)
+    ).lower()
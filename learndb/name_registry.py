@@ -56,6 +56,20 @@ class NameRegistry:
         # NOTE: this was adapated from vm.check_resolve_name
         raise NotImplementedError
 
+    def resolve_name_value(self, operand):
+        """
+        Like resolve_name, but returns the resolved value directly, with
+        lookup failures propagating as InvalidNameException. Expression
+        evaluation calls this per operand per record, where the Response
+        wrapper is a pure allocation; callers needing to distinguish
+        resolve-failed from resolved-to-None should use resolve_name.
+        """
+        if isinstance(operand, ColumnName):
+            return self.record.get(operand.name)
+
+        # NOTE: this was adapated from vm.check_resolve_name
+        raise NotImplementedError
+
     def resolve_column_name_type(self, operand: str) -> Response:
         """
         Determine type of column name
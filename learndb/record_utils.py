@@ -80,12 +80,14 @@ class SimpleRecord(AbstractRecord):
 
     def at_index(self, pos: int):
         """
-        return
+        return value of column at position `pos` (definition order)
         """
-        columns = self.schema.cols
-        if pos >= len(columns):
-            raise ValueError(f"Invalid index {pos}; expected [0, {len(columns)-1}]")
-        return self.values[columns[pos].name.lower()]
+        # the schema caches the position -> name table; this avoids
+        # rebuilding the name per call from the column objects
+        names = self.schema.get_column_names()
+        if pos >= len(names):
+            raise ValueError(f"Invalid index {pos}; expected [0, {len(names)-1}]")
+        return self.values[names[pos]]
 
     def has_column(self, column: str) -> bool:
         """
@@ -116,6 +118,11 @@ class ScopedRecord(AbstractRecord):
     def __init__(self, name_to_records: dict, schema: ScopedSchema):
         self.names = name_to_records
         self.schema = schema
+        # lazily populated cache: fq column name -> value. get() parses the
+        # fqname and walks the per-source records on every call; conditions
+        # probe the same few names per record, so resolve each name once.
+        # records are read-only, so cached values cannot go stale
+        self._resolved = {}
 
     @classmethod
     def from_records(
@@ -179,6 +186,8 @@ class ScopedRecord(AbstractRecord):
         """
         Given a fq column name, e.g. f.cola
         """
+        if fqname in self._resolved:
+            return self._resolved[fqname]
         parts = fqname.split(".")
         if len(parts) != 2:
             raise InvalidNameException(
@@ -189,10 +198,12 @@ class ScopedRecord(AbstractRecord):
             raise ValueError(f"Uknown table alias [{table}]")
         record = self.names[table]
         if isinstance(record, SimpleRecord):
-            return record.get(column)
+            value = record.get(column)
         else:
             assert isinstance(record, ScopedRecord)
-            return record.get(fqname)
+            value = record.get(fqname)
+        self._resolved[fqname] = value
+        return value
 
     def has_columns(self, *args):
         """
@@ -83,6 +83,12 @@ class SimpleSchema(AbstractSchema):
         self.name = name
         # list of column objects ordered by definition order
         self.cols = columns
+        # primary-key column name; lazily computed and cached by
+        # get_primary_key_column (schema is read-only once constructed)
+        self.pkey_column_name = None
+        # lowercased column names in definition order; lazily computed and
+        # cached by get_column_names
+        self.ordered_column_names = None
 
     @property
     def columns(self):
@@ -98,12 +104,26 @@ class SimpleSchema(AbstractSchema):
     def get_primary_key_column(self) -> Optional[str]:
         """
         return column name of primary key column
+        the name is cached on first lookup, since this is invoked
+        per-record in scan loops, e.g. when collecting keys to delete
         :return:
         """
-        for column in self.columns:
-            if column.is_primary_key:
-                return column.name
-        return None
+        if self.pkey_column_name is None:
+            for column in self.columns:
+                if column.is_primary_key:
+                    self.pkey_column_name = column.name
+                    break
+        return self.pkey_column_name
+
+    def get_column_names(self) -> List[str]:
+        """
+        return lowercased column names, in definition order.
+        the list is cached on first lookup, since positional record access
+        (Record.at_index) needs the name for a given position per call
+        """
+        if self.ordered_column_names is None:
+            self.ordered_column_names = [col.name.lower() for col in self.cols]
+        return self.ordered_column_names
 
     def get_column_by_name(self, name) -> Optional[Column]:
         name = name.lower()
@@ -175,6 +175,44 @@ def deserialize_cell(cell: bytes, schema: SimpleSchema) -> Response:
     :param schema:
     :return: Response[Record]
     """
+    return Response(True, body=deserialize_cell_record(cell, schema))
+
+
+def _schema_cell_layout(schema: SimpleSchema):
+    """
+    Return (key column name, non-key column names, all column names) for
+    `schema`. The layout is a pure function of the schema- which is
+    read-only once constructed- and is computed per record otherwise;
+    cache it on the schema on first use.
+    """
+    layout = getattr(schema, "_cell_layout", None)
+    if layout is None:
+        key_columns = [col.name for col in schema.columns if col.is_primary_key]
+        assert len(key_columns) == 1, "More than 1 key column"
+        non_key_columns = [
+            col.name for col in schema.columns if not col.is_primary_key
+        ]
+        all_columns = [col.name for col in schema.columns]
+        layout = (key_columns[0], non_key_columns, all_columns)
+        schema._cell_layout = layout
+    return layout
+
+
+def deserialize_cell_record(cell: bytes, schema: SimpleSchema) -> SimpleRecord:
+    """
+    deserialize cell corresponding to schema, and return the record directly.
+    This is the entry point for scan loops- deserialization has no failure
+    modes that are reported via Response (malformed cells raise), so
+    wrapping every record in a Response is pure allocation overhead.
+    The schema-dependent parts of the cell layout (key column, non-key
+    column order) are precomputed once per schema, rather than rederived
+    per record.
+    :param cell:
+    :param schema:
+    :return: SimpleRecord
+    """
+    key_column_name, non_key_columns, all_columns = _schema_cell_layout(schema)
+
     values = {}  # colname -> value
     # read the columns in the cell
     offset = 0
@@ -187,10 +225,6 @@ def deserialize_cell(cell: bytes, schema: SimpleSchema) -> Response:
     # bytes corresponding to key
     key_bytes = cell[offset : offset + key_size]
     key = Integer.deserialize(key_bytes)
-    key_columns = [col.name for col in schema.columns if col.is_primary_key]
-
-    assert len(key_columns) == 1, "More than 1 key column"
-    key_column_name = key_columns[0]
     values[key_column_name] = key
     # after this, offset points past the key bytes, i.e. to the first
     # byte of data payload
@@ -232,23 +266,20 @@ def deserialize_cell(cell: bytes, schema: SimpleSchema) -> Response:
             )
             header_offset += INTEGER_SIZE
 
-        # resolve column name
-        column = schema.columns[col_pos]
+        # resolve column name; the key column is excluded from the
+        # precomputed ordering, i.e. no per-column is_primary_key check
+        column_name = non_key_columns[col_pos]
         col_pos += 1
-        if column.is_primary_key:
-            # we've already handled the key column above; consider next column
-            column = schema.columns[col_pos]
-            col_pos += 1
 
         # read body
         if datatype.is_fixed_length and not datatype.is_serializable:
             # handle fixed-value type, i.e. only null for now, boolean's would be similar
             assert datatype == Null
-            values[column.name] = None
+            values[column_name] = None
         elif datatype.is_fixed_length:
             # handle fixed-length type
             # increment body by a fixed amount
-            values[column.name] = datatype.deserialize(
+            values[column_name] = datatype.deserialize(
                 cell[data_offset : data_offset + datatype.fixed_length]
             )
             data_offset += datatype.fixed_length
@@ -258,16 +289,15 @@ def deserialize_cell(cell: bytes, schema: SimpleSchema) -> Response:
             # handle variable length type
             # increment body by a variable amount
             data_bstring = cell[data_offset : data_offset + varlen]
-            values[column.name] = datatype.deserialize(data_bstring)
+            values[column_name] = datatype.deserialize(data_bstring)
             data_offset += varlen
 
     # add non-existent columns with null values
-    for column in schema.columns:
-        if column.name not in values:
-            values[column.name] = None
+    for column_name in all_columns:
+        if column_name not in values:
+            values[column_name] = None
 
-    record = SimpleRecord(values, schema)
-    return Response(True, body=record)
+    return SimpleRecord(values, schema)
 
 
 def get_cell_key(cell: bytes) -> int:
@@ -3,9 +3,7 @@ class representing a logical-database
 support API to read/write data via Table
 and creating tables etc.
 """
-import random
-import string
-from collections import UserList, UserDict
+from collections import UserDict
 from typing import Optional, List, Union, Tuple
 
 from .btree import Tree
@@ -22,14 +20,6 @@ from .schema import (
 )
 
 
-class RecordSet(UserList):
-    """
-    Maintains a list of records
-    """
-
-    pass
-
-
 class GroupedRecordSet(UserDict):
     """
     Maintains a dictionary of lists of records, where the dict is
@@ -70,11 +60,11 @@ class Scope:
     def register_unaliased_source(self, source: str):
         raise NotImplementedError
 
-    def get_recordset(self, name: str) -> Optional[RecordSet]:
+    def get_recordset(self, name: str) -> Optional[List]:
         return self.record_sets.get(name)
 
     def add_recordset(
-        self, name: str, schema: NonGroupedSchema, recordset: RecordSet
+        self, name: str, schema: NonGroupedSchema, recordset: List
     ) -> None:
         """
         Upsert a new recordset with `name`
@@ -147,6 +137,8 @@ class StateManager:
         self.trees = {}
         # scope stack
         self.scopes: List[Scope] = []
+        # monotonic sequence backing recordset names
+        self.recordset_seq = 0
 
     def close(self):
         """
@@ -220,43 +212,23 @@ class StateManager:
 
     # recordset management
 
-    @staticmethod
-    def gen_randkey(size=10, prefix=""):
-        return prefix + "".join(
-            random.choice(string.ascii_letters) for i in range(size)
-        )
-
     def unique_recordset_name(self) -> str:
         """
-        Generate a recordset name unique across all scopes
+        Generate a recordset name unique across all scopes.
+        Names are drawn from a monotonic sequence- unique by construction,
+        replacing the generate-random-name-and-probe-all-scopes loop that
+        ran for every recordset a statement created.
         """
-        is_unique = False
-        name = None
-        while not is_unique:
-            name = self.gen_randkey(prefix="r")
-            # name must be unique across all scopes
-            for scope in self.scopes:
-                if scope.get_recordset(name) is not None:
-                    break
-            else:
-                is_unique = True
-        return name
+        self.recordset_seq += 1
+        return f"r{self.recordset_seq}"
 
     def unique_grouped_recordset_name(self) -> str:
         """
-        Generate a recordset name unique across all scopes
+        Generate a grouped recordset name unique across all scopes.
+        See unique_recordset_name; the sequence is shared.
         """
-        is_unique = False
-        name = None
-        while not is_unique:
-            name = self.gen_randkey(prefix="g")
-            # name must be unique across all scopes
-            for scope in self.scopes:
-                if scope.get_grouped_recordset(name) is not None:
-                    break
-            else:
-                is_unique = True
-        return name
+        self.recordset_seq += 1
+        return f"g{self.recordset_seq}"
 
     def init_recordset(self, schema: Union[SimpleSchema, ScopedSchema]) -> Response:
         """
@@ -266,7 +238,9 @@ class StateManager:
         """
         name = self.unique_recordset_name()
         scope = self.scopes[-1]
-        scope.add_recordset(name, schema, RecordSet())
+        # recordsets are backed by plain lists- a wrapper type adds a layer
+        # of dispatch on every append/iterate in the scan loops
+        scope.add_recordset(name, schema, [])
         return Response(True, body=name)
 
     def init_grouped_recordset(self, schema: GroupedSchema):
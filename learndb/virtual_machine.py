@@ -15,6 +15,7 @@ from .btree import Tree, TreeInsertResult, TreeDeleteResult
 from .constants import CATALOG
 from .cursor import Cursor
 from .dataexchange import Response
+from .datatypes import Real
 from .functions import resolve_function_name
 from .lang_parser.visitor import Visitor
 from .lang_parser.symbols import (
@@ -24,14 +25,20 @@ from .lang_parser.symbols import (
     SingleSource,
     JoinType,
     Joining,
+    UnconditionedJoin,
+    ConditionedJoin,
     WhereClause,
     TableName,
     HavingClause,
     SelectClause,
     FuncCall,
     ColumnName,
+    Comparison,
+    ComparisonOp,
     Literal,
     Expr,
+    OrClause,
+    AndClause,
     InsertStmnt,
     DropStmnt,
     OrderByClause,
@@ -60,7 +67,7 @@ from .schema import (
     GroupedSchema,
     Column,
 )
-from .serde import serialize_record, deserialize_cell
+from .serde import serialize_record, deserialize_cell_record, get_cell_key
 
 from .value_generators import (
     ValueGeneratorFromRecordOverFunc,
@@ -69,6 +76,7 @@ from .value_generators import (
     ValueGeneratorFromNoRecordOverExpr,
 )
 from .vm_utils import datatype_from_symbolic_datatype
+from .expression_compiler import compile_condition
 from .expression_interpreter import ExpressionInterpreter
 from .name_registry import NameRegistry
 from .semantic_analysis import SemanticAnalyzer
@@ -76,6 +84,14 @@ from .semantic_analysis import SemanticAnalyzer
 logger = logging.getLogger(__name__)
 
 
+# cache of catalog schemas, keyed by the DDL text stored in the catalog.
+# every VM boot re-parses the DDL of every table to rebuild its schema;
+# the schema is a pure function of the DDL text, and schemas are read-only
+# once constructed, so parses can be shared across boots in a process,
+# e.g. re-opening a database in a REPL session
+_catalog_schema_cache = {}
+
+
 @dataclass
 class VMConfig:
     """
@@ -132,6 +148,16 @@ class VirtualMachine(Visitor):
         self.name_registry = NameRegistry()
         self.interpreter = ExpressionInterpreter(self.name_registry)
         self.type_checker = SemanticAnalyzer(self.name_registry)
+        # 2.1. source-type -> materialization handler; a dict lookup on the
+        # concrete type replaces the isinstance chain in materialize.
+        # NOTE: Joining is an ABC with the join classes registered as
+        # virtual subclasses, so the table is keyed by the concrete types
+        self.materialize_handlers = {
+            SingleSource: self.materialize_single_source,
+            TableName: self.materialize_table_name,
+            UnconditionedJoin: self.materialize_joining,
+            ConditionedJoin: self.materialize_joining,
+        }
         # 3. parameters to control VM behavior
         # 3.1. whether to stop a program execution on first statement failure
         self.stop_program_on_statement_failure = (
@@ -156,35 +182,34 @@ class VirtualMachine(Visitor):
         parser = SqlFrontEnd()
 
         # iterate over table entries
-        while cursor.end_of_table is False:
-            cell = cursor.get_cell()
-            resp = deserialize_cell(cell, catalog_schema)
-            assert resp.success, "deserialize failed while bootstrapping catalog"
-            table_record = resp.body
-
-            # get schema by parsing sql_text
+        for cell in cursor.cell_iter():
+            table_record = deserialize_cell_record(cell, catalog_schema)
+            # unpack the catalog fields once
+            table_name = table_record.get("name")
+            root_pagenum = table_record.get("root_pagenum")
             sql_text = table_record.get("sql_text")
-            logging.info(f"bootstrapping schema from [{sql_text}]")
-            parser.parse(sql_text)
-            assert parser.is_success(), "catalog sql parse failed"
-            program = parser.get_parsed()
-            assert len(program.statements) == 1
-            stmnt = program.statements[0]
-            assert isinstance(stmnt, CreateStmnt)
-            resp = generate_schema(stmnt)
-            assert resp.success, "schema generation failed"
-            table_schema = resp.body
+
+            # get schema by parsing sql_text; re-parses are served from cache
+            table_schema = _catalog_schema_cache.get(sql_text)
+            if table_schema is None:
+                logging.info(f"bootstrapping schema from [{sql_text}]")
+                parser.parse(sql_text)
+                assert parser.is_success(), "catalog sql parse failed"
+                program = parser.get_parsed()
+                assert len(program.statements) == 1
+                stmnt = program.statements[0]
+                assert isinstance(stmnt, CreateStmnt)
+                resp = generate_schema(stmnt)
+                assert resp.success, "schema generation failed"
+                table_schema = resp.body
+                _catalog_schema_cache[sql_text] = table_schema
 
             # get tree
-            tree = Tree(
-                self.state_manager.get_pager(), table_record.get("root_pagenum")
-            )
+            tree = Tree(self.state_manager.get_pager(), root_pagenum)
 
             # register schema
-            self.state_manager.register_schema(table_record.get("name"), table_schema)
-            self.state_manager.register_tree(table_record.get("name"), tree)
-
-            cursor.advance()
+            self.state_manager.register_schema(table_name, table_schema)
+            self.state_manager.register_tree(table_name, tree)
 
     def terminate(self):
         """
@@ -231,8 +256,9 @@ class VirtualMachine(Visitor):
             - nested Response is the response of each child statement
         """
         stmnt_responses = []
+        execute = self.execute
         for stmt in program.statements:
-            stmnt_resp = self.execute(stmt)
+            stmnt_resp = execute(stmt)
             if self.stop_program_on_statement_failure and stmnt_resp.success is False:
                 # early exit
                 return Response(
@@ -297,7 +323,8 @@ class VirtualMachine(Visitor):
         # 7. register schema
         self.state_manager.register_schema(table_name, table_schema)
         # 8. register tree
-        tree = Tree(self.state_manager.get_pager(), table_record.get("root_pagenum"))
+        # NOTE: page_num is the root page of the new table's tree
+        tree = Tree(self.state_manager.get_pager(), page_num)
         self.state_manager.register_tree(table_name, tree)
         return Response(True)
 
@@ -315,18 +342,13 @@ class VirtualMachine(Visitor):
         # 1.1. find key of table _to_be_deleted in catalog
         table_key = None
         # iterate over table entries
-        while cursor.end_of_table is False:
-            cell = cursor.get_cell()
-            resp = deserialize_cell(cell, catalog_schema)
-            assert resp.success, "deserialize failed while reading catalog"
-            table_record = resp.body
+        for cell in cursor.cell_iter():
+            table_record = deserialize_cell_record(cell, catalog_schema)
 
             if table_record.get("name") == table_to_drop:
                 table_key = table_record.get("pkey")
                 break
 
-            cursor.advance()
-
         if table_key is None:
             logging.warning(f"Attempted delete on non-existent table [{table_to_drop}]")
             return Response(False)
@@ -353,26 +375,55 @@ class VirtualMachine(Visitor):
         rsname = None  # name of result set
         from_clause = stmnt.from_clause
         if from_clause:
-            # materialize source in from clause
-            resp = self.materialize(stmnt.from_clause.source.source)
-            if not resp.success:
-                return Response(
-                    False,
-                    error_message=f"[from_clause] source materialization failed due to {resp.error_message}",
+            # 2.1. check whether the where clause is a primary-key point
+            # lookup, which can be pushed down to a b-tree seek
+            key_lookup = None
+            if from_clause.where_clause:
+                key_lookup = self.sargable_key_equality(
+                    from_clause.where_clause.condition, from_clause.source.source
                 )
-            rsname = resp.body
 
-            # 3. apply filter on source - where clause
-            if from_clause.where_clause:
-                resp = self.filter_recordset(from_clause.where_clause, rsname)
+            if key_lookup is not None:
+                # the seek fully consumes the where clause
+                resp = self.materialize_key_lookup(*key_lookup)
+                assert resp.success
+                rsname = resp.body
+            else:
+                source = from_clause.source.source
+                where_clause = from_clause.where_clause
+                if where_clause and isinstance(source, (SingleSource, TableName)):
+                    # 2.2. single-table source: fuse the filter into the
+                    # scan- a single pass materializing only matching
+                    # records, instead of a full materialize + filter pass
+                    if isinstance(source, TableName):
+                        source = SingleSource(source)
+                    resp = self.materialize_single_source(source, where_clause)
+                    # the scan consumed the where clause
+                    where_clause = None
+                else:
+                    # materialize source in from clause
+                    resp = self.materialize(source)
                 if not resp.success:
                     return Response(
                         False,
-                        error_message=f"[where_clause] filtering failed due to {resp.error_message}",
+                        error_message=f"[from_clause] source materialization failed due to {resp.error_message}",
                     )
-                # filtering produces a new resultset
                 rsname = resp.body
 
+                # 3. apply filter on source - where clause (join sources only;
+                # single-table sources filter during the scan)
+                if where_clause:
+                    resp = self.filter_recordset(where_clause, rsname)
+                    if not resp.success:
+                        return Response(
+                            False,
+                            error_message=f"[where_clause] filtering failed due to {resp.error_message}",
+                        )
+                    # the filtered output supersedes its input; drop the
+                    # input eagerly rather than holding both until scope end
+                    self.drop_recordset(rsname)
+                    rsname = resp.body
+
             # 4. apply group by clause
             if from_clause.group_by_clause:
                 resp = self.group_recordset(from_clause.group_by_clause, rsname)
@@ -381,6 +432,9 @@ class VirtualMachine(Visitor):
                         False,
                         error_message=f"[group_by_clause] failed due to {resp.error_message}",
                     )
+                # the grouped set holds every input record; the flat input
+                # is no longer needed
+                self.drop_recordset(rsname)
                 rsname = resp.body
 
             # 5. apply having clause
@@ -396,28 +450,45 @@ class VirtualMachine(Visitor):
         # another approach, would be for the name_registry to be initialized with the
         # StateManager, and then the NameRegistry could get any schema it needed. However, this would
         # additionally require a way to register joined recordsets, and groupedrecordsets to the StateManager
-        self.name_registry.set_schema(self.get_recordset_schema(rsname))
+        source_schema = self.get_recordset_schema(rsname)
+        self.name_registry.set_schema(source_schema)
+
+        # if no downstream clause needs the output resultset, stream output
+        # records straight to the output pipe; this fuses the select-clause
+        # evaluation with the final write, skipping the intermediate
+        # resultset and the second pass over it
+        needs_resultset = from_clause and (
+            from_clause.order_by_clause or from_clause.limit_clause
+        )
+        sink = None if needs_resultset else self.output_pipe.write
 
-        resp = self.evaluate_select_clause(stmnt.select_clause, rsname)
+        resp = self.evaluate_select_clause(stmnt.select_clause, rsname, sink)
         if not resp.success:
             return resp
+        # the select output (or sink) supersedes its source; grouped sources
+        # are torn down with the scope, since scopes don't support dropping
+        # grouped recordsets
+        if rsname is not None and not isinstance(source_schema, GroupedSchema):
+            self.drop_recordset(rsname)
         rsname = resp.body
 
         # 7. if from_clause, evaluate order, limit clause
-        if from_clause:
+        if needs_resultset:
             if from_clause.order_by_clause:
                 resp = self.evaluate_order_by_clause(
                     from_clause.order_by_clause, rsname
                 )
                 assert resp.success
+                self.drop_recordset(rsname)
                 rsname = resp.body
             if from_clause.limit_clause:
                 resp = self.evaluate_limit_clause(from_clause.limit_clause, rsname)
                 assert resp.success
+                self.drop_recordset(rsname)
                 rsname = resp.body
 
-        for record in self.recordset_iter(rsname):
-            self.output_pipe.write(record)
+            for record in self.recordset_iter(rsname):
+                self.output_pipe.write(record)
 
         # end scope, and recycle any ephemeral objects in scope
         self.end_scope()
@@ -503,8 +574,10 @@ class VirtualMachine(Visitor):
     def visit_insert_stmnt(self, stmnt: InsertStmnt) -> Response:
         """
         handle insert stmnt
+        NOTE: inserts create no ephemeral recordsets, hence no statement
+        scope is needed- this keeps the per-insert cost to record
+        construction, serialization, and the tree insert
         """
-        self.begin_scope()
         table_name = stmnt.table_name.table_name
         if not self.state_manager.has_schema(table_name):
             # check if table exists
@@ -529,7 +602,6 @@ class VirtualMachine(Visitor):
         cell = resp.body
         resp = tree.insert(cell)
         assert resp == TreeInsertResult.Success, f"Insert op failed with status: {resp}"
-        self.end_scope()
         return Response(True, body=TreeInsertResult.Success)
 
     def visit_delete_stmnt(self, stmnt) -> Response:
@@ -537,35 +609,87 @@ class VirtualMachine(Visitor):
         handle delete stmnt
         """
         self.begin_scope()
-        # 1. iterate over source dataset
-        # materializing the entire recordset is expensive, but cleaner/easier/faster to implement
-        resp = self.materialize(stmnt.table_name)
-        assert resp.success
-        rsname = resp.body
-
+        table_name = stmnt.table_name.table_name
+        key_lookup = None
         if stmnt.where_condition:
-            resp = self.filter_recordset(stmnt.where_condition, rsname)
+            key_lookup = self.sargable_key_equality(
+                stmnt.where_condition.condition, stmnt.table_name
+            )
+        if key_lookup is not None:
+            # 1a. point delete on the primary key- seek the key instead of
+            # scanning; the key list is the key itself, if it exists
+            _, key = key_lookup
+            del_keys = [key] if self.key_exists(table_name, key) else []
+        elif stmnt.where_condition and self.is_key_only_condition(
+            stmnt.where_condition.condition, table_name
+        ):
+            # 1b. the condition references only the primary-key column, whose
+            # value is read directly from each cell- i.e. matching keys are
+            # determined without deserializing and materializing full records
+            del_keys = self.collect_matching_keys(
+                stmnt.where_condition.condition, table_name
+            )
+        else:
+            # 1c. iterate over source dataset
+            # materializing the entire recordset is expensive, but cleaner/easier/faster to implement
+            resp = self.materialize(stmnt.table_name)
             assert resp.success
             rsname = resp.body
 
-        # 2. create list of keys to delete
-        del_keys = []
-        for record in self.recordset_iter(rsname):
-            del_keys.append(record.get_primary_key())
+            if stmnt.where_condition:
+                resp = self.filter_recordset(stmnt.where_condition, rsname)
+                assert resp.success
+                rsname = resp.body
+
+            # 2. create list of keys to delete
+            del_keys = [
+                record.get_primary_key() for record in self.recordset_iter(rsname)
+            ]
 
-        # 3. delete the keys
-        table_name = stmnt.table_name.table_name
+        # 3. delete the keys as a batch
         tree = self.get_tree(table_name)
-        for del_key in del_keys:
-            resp = tree.delete(del_key)
-            if resp != TreeDeleteResult.Success:
-                logging.warning(f"delete failed for key {del_key}")
-                return Response(False, resp)
+        resp = tree.delete_keys(del_keys)
+        if resp != TreeDeleteResult.Success:
+            logging.warning(f"delete failed for keys {del_keys}")
+            return Response(False, resp)
 
         self.end_scope()
         # return list of deleted keys
         return Response(True, body=del_keys)
 
+    def is_key_only_condition(self, condition, table_name: str) -> bool:
+        """
+        Return True if `condition` references no columns other than the
+        primary-key column of `table_name`. For such conditions full
+        records are not needed for evaluation.
+        """
+        schema = self.get_schema(table_name)
+        pkey_column = schema.get_primary_key_column()
+        if pkey_column is None:
+            return False
+        column_refs = condition.find_descendents(ColumnName)
+        return all(
+            str(column.name).lower() == pkey_column for column in column_refs
+        )
+
+    def collect_matching_keys(self, condition, table_name: str) -> List[int]:
+        """
+        Scan the table and return keys of cells matching `condition`,
+        where `condition` only references the primary-key column.
+        The key is read directly from each cell, and the condition
+        evaluated over a key-only record- skipping cell deserialization.
+        """
+        schema = self.get_schema(table_name)
+        pkey_column = schema.get_primary_key_column()
+        predicate = self.make_condition_predicate(condition)
+        cursor = Cursor(self.state_manager.get_pager(), self.get_tree(table_name))
+        matching_keys = []
+        for cell in cursor.cell_iter():
+            key = get_cell_key(cell)
+            if predicate(SimpleRecord({pkey_column: key}, schema)):
+                matching_keys.append(key)
+        return matching_keys
+
     # section : general statement helpers
 
     def get_schema(self, table_name: str) -> AbstractSchema:
@@ -584,35 +708,140 @@ class VirtualMachine(Visitor):
 
     # section : select statement helpers
 
-    def materialize(self, source) -> Response:
+    @staticmethod
+    def unwrap_simple_condition(condition) -> Optional[Comparison]:
         """
-        Materialize source.
+        If `condition` is a single comparison- possibly wrapped in
+        single-child expr/or/and nodes- return the comparison; else None
         """
-        if isinstance(source, SingleSource):
-            # NOTE: single source means a single physical table
-            return self.materialize_single_source(source)
+        node = condition
+        while True:
+            if isinstance(node, Expr):
+                node = node.expr
+            elif isinstance(node, OrClause) and len(node.and_clauses) == 1:
+                node = node.and_clauses[0]
+            elif isinstance(node, AndClause) and len(node.predicates) == 1:
+                node = node.predicates[0]
+            else:
+                break
+        return node if isinstance(node, Comparison) else None
 
+    def sargable_key_equality(self, condition, source) -> Optional[Tuple[str, int]]:
+        """
+        Determine whether `condition` over `source` can be answered by a
+        b-tree seek, i.e. source is a single unaliased table, and condition
+        is a single equality between its primary-key column and an integer
+        literal. Return (table_name, key) if so; else None.
+        """
+        # resolve source to a table name; aliased sources produce scoped
+        # records, whose condition refs the seek path doesn't handle
+        if isinstance(source, SingleSource):
+            if source.table_alias is not None:
+                return None
+            table_name = source.table_name.table_name
         elif isinstance(source, TableName):
-            source = SingleSource(source)
-            return self.materialize_single_source(source)
+            table_name = source.table_name
+        else:
+            return None
+        table_name = table_name.lower()
+        if table_name != CATALOG and not self.state_manager.has_schema(table_name):
+            return None
+
+        comparison = self.unwrap_simple_condition(condition)
+        if comparison is None or comparison.operator != ComparisonOp.Equal:
+            return None
+        pkey_column = self.get_schema(table_name).get_primary_key_column()
+        if pkey_column is None:
+            return None
+        # the equality may be written either way around, i.e. `pkey = 4` or `4 = pkey`
+        operands = (comparison.left_op, comparison.right_op)
+        for column, literal in (operands, operands[::-1]):
+            if (
+                isinstance(column, ColumnName)
+                and str(column.name).lower() == pkey_column
+                and isinstance(literal, Literal)
+                and isinstance(literal.value, int)
+            ):
+                return table_name, literal.value
+        return None
+
+    def key_exists(self, table_name: str, key: int) -> bool:
+        """
+        Return whether `table_name` contains a record with primary key
+        `key`, located via a b-tree seek.
+        """
+        tree = self.get_tree(table_name)
+        page_num, cell_num = tree.find(key)
+        node = self.state_manager.get_pager().get_page(page_num)
+        return (
+            cell_num < Tree.leaf_node_num_cells(node)
+            and Tree.leaf_node_key(node, cell_num) == key
+        )
 
-        elif isinstance(source, Joining):
-            return self.materialize_joining(source)
+    def materialize_key_lookup(self, table_name: str, key: int) -> Response:
+        """
+        Materialize a recordset containing the record with primary key
+        `key` from `table_name`, located via a b-tree seek- or an empty
+        recordset if the key does not exist.
+        """
+        schema = self.get_schema(table_name)
+        tree = self.get_tree(table_name)
+        resp = self.init_recordset(schema)
+        assert resp.success
+        rsname = resp.body
 
-        else:
+        page_num, cell_num = tree.find(key)
+        node = self.state_manager.get_pager().get_page(page_num)
+        if (
+            cell_num < Tree.leaf_node_num_cells(node)
+            and Tree.leaf_node_key(node, cell_num) == key
+        ):
+            cell = Tree.leaf_node_cell(node, cell_num)
+            record = deserialize_cell_record(cell, schema)
+            self.append_recordset(rsname, record)
+        return Response(True, body=rsname)
+
+    def materialize(self, source) -> Response:
+        """
+        Materialize source, dispatching on its concrete type.
+        """
+        handler = self.materialize_handlers.get(type(source))
+        if handler is None:
             raise ValueError(f"Unknown materialization source type {source}")
+        return handler(source)
 
-    def materialize_single_source(self, source: SingleSource) -> Response:
+    def materialize_table_name(self, source: TableName) -> Response:
+        """
+        Materialize a bare table name, i.e. an unaliased single source.
         """
-        Materialize single source and return
+        return self.materialize_single_source(SingleSource(source))
+
+    def materialize_single_source(
+        self, source: SingleSource, where_clause: WhereClause = None
+    ) -> Response:
+        """
+        Materialize single source and return.
+        If `where_clause` is given, the filter is fused into the scan, i.e.
+        only matching records are materialized and no separate filter pass
+        (with its intermediate recordset) is needed.
         """
         assert isinstance(source, SingleSource), f"Unexpected {source}"
 
+        predicate = None
+        if where_clause is not None:
+            # without an alias, scans yield SimpleRecords- the predicate can
+            # specialize to direct values lookups
+            predicate = self.make_condition_predicate(
+                where_clause.condition,
+                direct_values=source.table_alias is None,
+            )
         # does table_names need to be resolved?
-        return self.materialize_source_from_name(source.table_name, source.table_alias)
+        return self.materialize_source_from_name(
+            source.table_name, source.table_alias, predicate
+        )
 
     def materialize_source_from_name(
-        self, table_name: TableName, table_alias: str = None
+        self, table_name: TableName, table_alias: str = None, predicate=None
     ) -> Response:
         # unwrap table_name
         table_name = table_name.table_name.lower()
@@ -638,12 +867,11 @@ class VirtualMachine(Visitor):
         rsname = resp.body
 
         cursor = Cursor(self.state_manager.get_pager(), tree)
+        # hoist the per-append scope search out of the scan loop
+        append_out = self.recordset_appender(rsname)
         # iterate over entire table
-        while cursor.end_of_table is False:
-            cell = cursor.get_cell()
-            resp = deserialize_cell(cell, schema)
-            assert resp.success
-            record = resp.body
+        for cell in cursor.cell_iter():
+            record = deserialize_cell_record(cell, schema)
             # if an alias is defined
             record = (
                 ScopedRecord.from_single_simple_record(record, table_alias, rs_schema)
@@ -651,9 +879,9 @@ class VirtualMachine(Visitor):
                 else record
             )
 
-            self.append_recordset(rsname, record)
-            # advance cursor
-            cursor.advance()
+            # if a filter was fused into this scan, only keep matches
+            if predicate is None or predicate(record):
+                append_out(record)
         return Response(True, body=rsname)
 
     def materialize_joining(self, source: Joining) -> Response:
@@ -719,10 +947,42 @@ class VirtualMachine(Visitor):
             )
             left_source_name = None
             assert resp.success
+            # the join has consumed both its inputs (the left side is streamed
+            # through a single-pass iterator); drop them eagerly, so in a chain
+            # of joins only the current joined recordset stays materialized
+            self.drop_recordset(rsname)
+            self.drop_recordset(next_rsname)
             rsname = resp.body
 
         return Response(True, body=rsname)
 
+    # section: condition evaluation helpers
+
+    def make_condition_predicate(self, condition, direct_values: bool = False):
+        """
+        Return a callable evaluating `condition` over a record, i.e. (record) -> bool.
+        Attempts to compile the condition into a specialized callable- avoiding
+        the per-record expression tree walk; conditions that cannot be source
+        compiled, e.g. containing function calls, are closure compiled, with the
+        interpreter evaluating only the unsupported sub-expressions.
+        The compiled predicate is cached on the condition node itself, so a
+        condition is compiled at most once, and the cache lives and dies
+        with its statement's AST- unlike a VM-level id-keyed cache, which
+        would grow for as long as the VM lives.
+        `direct_values` may be set when the condition is only evaluated over
+        SimpleRecords, to specialize column references to direct values-dict
+        lookups; a given condition is only ever evaluated over records of
+        one shape, so the flag cannot flip between lookups.
+        """
+        predicate = getattr(condition, "_compiled_predicate", None)
+        if predicate is not None:
+            return predicate
+        predicate = compile_condition(
+            condition, self.interpreter, direct_values=direct_values
+        )
+        condition._compiled_predicate = predicate
+        return predicate
+
     # section: where clause helpers
 
     def filter_recordset(
@@ -739,13 +999,15 @@ class VirtualMachine(Visitor):
         # generate new result set
         rsname = resp.body
 
-        for record in self.recordset_iter(source_rsname):
-            value = self.interpreter.evaluate_over_record(
-                where_clause.condition, record
-            )
-            assert isinstance(value, bool), f"Expected bool, received {type(value)}"
-            if value:
-                self.append_recordset(rsname, record)
+        predicate = self.make_condition_predicate(
+            where_clause.condition,
+            direct_values=isinstance(schema, SimpleSchema),
+        )
+        # evaluate the filter batch-at-a-time: filter() runs the
+        # predicate-and-select loop at C level, and the survivors are
+        # appended to the output recordset in a single extend
+        out_recordset = self.get_recordset(rsname)
+        out_recordset.extend(filter(predicate, self.recordset_iter(source_rsname)))
 
         return Response(True, body=rsname)
 
@@ -786,6 +1048,87 @@ class VirtualMachine(Visitor):
 
     # section: join clause helpers
 
+    @staticmethod
+    def extract_equi_join_columns(condition) -> Optional[Tuple[ColumnName, ColumnName]]:
+        """
+        If `condition` is a single equality comparison between two column
+        references, e.g. `f.cola = b.colb`, return the pair of column refs;
+        else return None. Used to decide whether a join can be evaluated as
+        a hash join.
+        """
+        node = VirtualMachine.unwrap_simple_condition(condition)
+        if node is None or node.operator != ComparisonOp.Equal:
+            return None
+        if isinstance(node.left_op, ColumnName) and isinstance(
+            node.right_op, ColumnName
+        ):
+            return node.left_op, node.right_op
+        return None
+
+    def resolve_join_sides(
+        self,
+        columns: Tuple[ColumnName, ColumnName],
+        left_schema,
+        right_schema,
+        left_sname: Optional[str],
+        right_sname: str,
+    ) -> Optional[Tuple]:
+        """
+        Given the column refs of an equi-join condition, determine which ref
+        belongs to the left and which to the right source, and return a pair
+        of join-key getters (left_getter, right_getter), each taking a record
+        of its side. Return None if the sides cannot be determined, or if
+        either key column is of Real type- reals are compared fuzzily, which
+        hashing cannot honor.
+        """
+        def make_key_getter(schema, column: ColumnName, alias: str, expected_alias):
+            """
+            Return a join-key getter for `column` over records with `schema`,
+            or None if the column cannot be resolved, or is of Real type.
+            Records of a scoped schema are keyed by the scoped name, records
+            of a simple schema by the base column name.
+            """
+            if isinstance(schema, ScopedSchema):
+                if alias not in schema.schemas:
+                    return None
+                key_name = str(column.name)
+            else:
+                # simple schema- the ref's alias must be the source's name
+                if str(alias) != str(expected_alias):
+                    return None
+                key_name = column.get_base_name()
+            key_column = schema.get_column_by_name(key_name)
+            if key_column is None or key_column.datatype == Real:
+                return None
+
+            def key_getter(record, _name=key_name):
+                return record.get(_name)
+
+            return key_getter
+
+        left_getter = None
+        right_getter = None
+        for column in columns:
+            alias = column.get_parent_alias()
+            if alias is None:
+                return None
+            if str(alias) == str(right_sname):
+                if right_getter is not None:
+                    # both refs on the right side
+                    return None
+                right_getter = make_key_getter(right_schema, column, alias, right_sname)
+                if right_getter is None:
+                    return None
+            else:
+                if left_getter is not None:
+                    # both refs on the left side
+                    return None
+                left_getter = make_key_getter(left_schema, column, alias, left_sname)
+                if left_getter is None:
+                    return None
+
+        return left_getter, right_getter
+
     def join_recordset(
         self,
         join_clause,
@@ -817,46 +1160,99 @@ class VirtualMachine(Visitor):
         resp = self.init_recordset(schema)
         assert resp.success
         rsname = resp.body
+        # hoist the per-append scope search out of the join loops
+        append_out = self.recordset_appender(rsname)
+
+        # whether the left side is a simple or a joined (scoped) record is
+        # fixed for the whole join- resolve the dispatch in
+        # ScopedRecord.from_records once, instead of per record pair
+        if isinstance(left_schema, SimpleSchema):
+            assert left_sname is not None
+
+            def make_joined_record(left_rec, right_rec):
+                return ScopedRecord.from_simple_records(
+                    left_rec, right_rec, left_sname, right_sname, schema
+                )
+
+        else:
+
+            def make_joined_record(left_rec, right_rec):
+                return ScopedRecord.from_joined_and_simple_record(
+                    left_rec, right_rec, right_sname, schema
+                )
 
         left_iter = self.recordset_iter(left_rsname)
+        # snapshot the right recordset once; every join flavor re-scans it,
+        # previously re-resolving it per left record
+        right_records = self.recordset_iter(right_rsname)
+        # bind the join-condition predicate once, instead of re-walking the
+        # condition expr per joined record pair (cross joins have no condition)
+        condition_predicate = None
+        if join_clause.join_type != JoinType.Cross:
+            condition_predicate = self.make_condition_predicate(join_clause.condition)
+
+        # if the condition is a single equality between a left and a right
+        # column, inner and left outer joins can be evaluated as a hash join:
+        # index the right recordset by join key once, then probe with each
+        # left record- O(left + right) rather than O(left * right)
+        join_key_getters = None
+        if join_clause.join_type in (JoinType.Inner, JoinType.LeftOuter):
+            columns = self.extract_equi_join_columns(join_clause.condition)
+            if columns is not None:
+                join_key_getters = self.resolve_join_sides(
+                    columns, left_schema, right_schema, left_sname, right_sname
+                )
+        if join_key_getters is not None:
+            left_key_getter, right_key_getter = join_key_getters
+            # build phase: index right records by join key
+            right_index = {}
+            for right_rec in right_records:
+                right_index.setdefault(right_key_getter(right_rec), []).append(
+                    right_rec
+                )
+            # probe phase
+            null_right_rec = None
+            if join_clause.join_type == JoinType.LeftOuter:
+                null_right_rec = create_null_record(right_schema)
+            for left_rec in left_iter:
+                matches = right_index.get(left_key_getter(left_rec))
+                if matches is None:
+                    if null_right_rec is not None:
+                        # left outer: unmatched left records join a null
+                        # right record
+                        append_out(make_joined_record(left_rec, null_right_rec))
+                    continue
+                for right_rec in matches:
+                    record = make_joined_record(left_rec, right_rec)
+                    append_out(record)
+            return Response(True, body=rsname)
+
         # inner join
         if join_clause.join_type == JoinType.Inner:
             for left_rec in left_iter:
                 # for each left record we need to iterate over each right_record
-                right_iter = self.recordset_iter(right_rsname)
-                for right_rec in right_iter:
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                for right_rec in right_records:
+                    record = make_joined_record(left_rec, right_rec)
+                    if condition_predicate(record):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        append_out(record)
 
         elif join_clause.join_type == JoinType.LeftOuter:
             for left_rec in left_iter:
                 # there should be at least one record each left record
                 left_record_added = False
-                right_iter = self.recordset_iter(right_rsname)
-                for right_rec in right_iter:
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                for right_rec in right_records:
+                    record = make_joined_record(left_rec, right_rec)
+                    if condition_predicate(record):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        append_out(record)
                         left_record_added = True
                 if not left_record_added:
                     # add a null right record
                     # create and join records
                     right_rec = create_null_record(right_schema)
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    self.append_recordset(rsname, record)
+                    record = make_joined_record(left_rec, right_rec)
+                    append_out(record)
 
         elif join_clause.join_type == JoinType.RightOuter:
             # there should be at least one record for each right record
@@ -864,74 +1260,65 @@ class VirtualMachine(Visitor):
             # index positions records in the right record set, and whether they have been joined.
             # this is problematic because it assumes the iter order of records in a recordset
             # will be the same, which isn't explicitly part of the recordset API
-            right_joined_index = [False for _ in self.recordset_iter(right_rsname)]
+            right_joined_index = [False] * len(right_records)
             for left_rec in left_iter:
-                right_iter = self.recordset_iter(right_rsname)
-                for index, right_rec in enumerate(right_iter):
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                for index, right_rec in enumerate(right_records):
+                    record = make_joined_record(left_rec, right_rec)
+                    if condition_predicate(record):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        append_out(record)
                         right_joined_index[index] = True
 
             # handle any un-joined right records
-            for index, right_rec in enumerate(self.recordset_iter(right_rsname)):
+            for index, right_rec in enumerate(right_records):
                 if right_joined_index[index]:
                     continue
+                # NOTE: the null left record is a SimpleRecord even over a
+                # scoped left schema, so it needs from_records' runtime
+                # dispatch; this runs once per unmatched right record only
                 left_rec = create_null_record(left_schema)
                 record = ScopedRecord.from_records(
                     left_rec, right_rec, left_sname, right_sname, schema
                 )
-                self.append_recordset(rsname, record)
+                append_out(record)
 
         elif join_clause.join_type == JoinType.FullOuter:
             # there should be atleast one record for each left and right record
-            left_record_added = False
-            right_joined_index = [False for _ in self.recordset_iter(right_rsname)]
+            right_joined_index = [False] * len(right_records)
             for left_rec in left_iter:
-                right_iter = self.recordset_iter(right_rsname)
-                for index, right_rec in enumerate(right_iter):
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                left_record_added = False
+                for index, right_rec in enumerate(right_records):
+                    record = make_joined_record(left_rec, right_rec)
+                    if condition_predicate(record):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        append_out(record)
                         left_record_added = True
                         right_joined_index[index] = True
                 if not left_record_added:
                     # add a null right record
                     # create and join records
                     right_rec = create_null_record(right_schema)
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    self.append_recordset(rsname, record)
+                    record = make_joined_record(left_rec, right_rec)
+                    append_out(record)
             # handle any un-joined right records
-            for index, right_rec in self.recordset_iter(right_rsname):
+            for index, right_rec in enumerate(right_records):
                 if right_joined_index[index]:
                     continue
+                # NOTE: the null left record is a SimpleRecord even over a
+                # scoped left schema, so it needs from_records' runtime
+                # dispatch; this runs once per unmatched right record only
                 left_rec = create_null_record(left_schema)
                 record = ScopedRecord.from_records(
                     left_rec, right_rec, left_sname, right_sname, schema
                 )
-                self.append_recordset(rsname, record)
+                append_out(record)
 
         else:
             assert join_clause.join_type == JoinType.Cross
             for left_rec in left_iter:
-                right_iter = self.recordset_iter(right_rsname)
-                for right_rec in right_iter:
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    self.append_recordset(rsname, record)
+                for right_rec in right_records:
+                    record = make_joined_record(left_rec, right_rec)
+                    append_out(record)
 
         return Response(True, body=rsname)
 
@@ -962,7 +1349,9 @@ class VirtualMachine(Visitor):
 
         return Response(True, body=rsname)
 
-    def evaluate_select_clause(self, select_clause: SelectClause, source_rsname: str):
+    def evaluate_select_clause(
+        self, select_clause: SelectClause, source_rsname: str, sink=None
+    ):
         """
         Evaluate the select clause.
         The select clause can be evaluated on 3 kinds of data sources:
@@ -974,19 +1363,24 @@ class VirtualMachine(Visitor):
         select max(id)
         from foo
         having
+
+        If `sink` (a callable accepting a record) is given, output records
+        are streamed to it instead of being materialized into an output
+        resultset, and the response body is None. This is only valid when no
+        downstream clause (order by, limit) needs the resultset.
         """
         # 1. no source
         if source_rsname is None:
-            return self.evaluate_select_clause_no_source(select_clause)
+            return self.evaluate_select_clause_no_source(select_clause, sink)
         else:
             source_schema = self.get_recordset_schema(source_rsname)
             if isinstance(source_schema, GroupedSchema):
                 return self.evaluate_select_clause_grouped_source(
-                    select_clause, source_rsname
+                    select_clause, source_rsname, sink
                 )
             else:
                 return self.evaluate_select_clause_ungrouped_source(
-                    select_clause, source_rsname
+                    select_clause, source_rsname, sink
                 )
 
     def generate_output_schema_no_source(self, selectables: List[Any]) -> Response:
@@ -1196,7 +1590,9 @@ class VirtualMachine(Visitor):
 
         return Response(True, body=generators)
 
-    def evaluate_select_clause_no_source(self, select_clause: SelectClause) -> Response:
+    def evaluate_select_clause_no_source(
+        self, select_clause: SelectClause, sink=None
+    ) -> Response:
         """
         Evaluate select on no source
         """
@@ -1220,23 +1616,25 @@ class VirtualMachine(Visitor):
             )
         value_generators = resp.body
 
-        # 3. generate output resultset
-        resp = self.init_recordset(out_schema)
-        assert resp.success
-        out_rsname = resp.body
+        # 3. generate output resultset, unless streaming to a sink
+        out_rsname = None
+        if sink is None:
+            resp = self.init_recordset(out_schema)
+            assert resp.success
+            out_rsname = resp.body
+            sink = self.recordset_appender(out_rsname)
 
-        # 4. populate output resultset- which will contain a single row
+        # 4. populate output- which will contain a single row
         out_column_names = [col.name for col in out_schema.columns]
         value_list = [val_gen.get_value() for val_gen in value_generators]
         resp = create_record_from_raw_values(out_column_names, value_list, out_schema)
         assert resp.success
-        out_record = resp.body
-        self.append_recordset(out_rsname, out_record)
+        sink(resp.body)
 
         return Response(True, body=out_rsname)
 
     def evaluate_select_clause_ungrouped_source(
-        self, select_clause: SelectClause, source_rsname: str
+        self, select_clause: SelectClause, source_rsname: str, sink=None
     ) -> Response:
         """
         This is a select on non-grouped source
@@ -1267,13 +1665,16 @@ class VirtualMachine(Visitor):
             )
         value_generators = resp.body
 
-        # 3. generate output resultset
-        resp = self.init_recordset(out_schema)
-        assert resp.success
-        out_rsname = resp.body
+        # 3. generate output resultset, unless streaming to a sink
+        out_rsname = None
+        if sink is None:
+            resp = self.init_recordset(out_schema)
+            assert resp.success
+            out_rsname = resp.body
+            sink = self.recordset_appender(out_rsname)
 
         out_column_names = [col.name for col in out_schema.columns]
-        # populate output resultset
+        # populate output
         for record in self.recordset_iter(source_rsname):
             # get value, one for each output column
             value_list = [val_gen.get_value(record) for val_gen in value_generators]
@@ -1282,13 +1683,12 @@ class VirtualMachine(Visitor):
                 out_column_names, value_list, out_schema
             )
             assert resp.success
-            out_record = resp.body
-            self.append_recordset(out_rsname, out_record)
+            sink(resp.body)
 
         return Response(True, body=out_rsname)
 
     def evaluate_select_clause_grouped_source(
-        self, select_clause: SelectClause, source_rsname: str
+        self, select_clause: SelectClause, source_rsname: str, sink=None
     ) -> Response:
         """
         This is a select on a grouped source
@@ -1316,14 +1716,17 @@ class VirtualMachine(Visitor):
             )
         value_generators = resp.body
 
-        # 3. generate output resultset
+        # 3. generate output resultset, unless streaming to a sink
         # NOTE: a groupedrecordset materializes to a resultset, i.e. groups are squashed
-        resp = self.init_recordset(out_schema)
-        assert resp.success
-        out_rsname = resp.body
+        out_rsname = None
+        if sink is None:
+            resp = self.init_recordset(out_schema)
+            assert resp.success
+            out_rsname = resp.body
+            sink = self.recordset_appender(out_rsname)
 
         out_column_names = [col.name for col in out_schema.columns]
-        # populate output resultset
+        # populate output
         for grouped_record in self.grouped_recordset_iter(source_rsname):
             # get value, one for each output column
             group_schema = self.state_manager.get_grouped_recordset_schema(
@@ -1338,8 +1741,7 @@ class VirtualMachine(Visitor):
                 out_column_names, value_list, out_schema
             )
             assert resp.success
-            out_record = resp.body
-            self.append_recordset(out_rsname, out_record)
+            sink(resp.body)
 
         return Response(True, body=out_rsname)
 
@@ -1362,8 +1764,9 @@ class VirtualMachine(Visitor):
         # sort
         sorted_records = self.quicksort(records, order_by_clause)
         # add to resultset
+        append_out = self.recordset_appender(rsname)
         for record in sorted_records:
-            self.append_recordset(rsname, record)
+            append_out(record)
 
         return Response(True, body=rsname)
 
@@ -1377,10 +1780,12 @@ class VirtualMachine(Visitor):
         assert resp.success
         # generate new result set
         rsname = resp.body
+        append_out = self.recordset_appender(rsname)
+        limit = limit_clause.limit.value
         for index, record in enumerate(self.recordset_iter(source_rsname)):
-            if index >= limit_clause.limit.value:
+            if index >= limit:
                 break
-            self.append_recordset(rsname, record)
+            append_out(record)
         return Response(True, body=rsname)
 
     # section: scope management
@@ -1427,6 +1832,23 @@ class VirtualMachine(Visitor):
     def append_recordset(self, name: str, record):
         return self.state_manager.append_recordset(name, record)
 
+    def get_recordset(self, name: str) -> List:
+        """
+        Return the underlying recordset (list) for `name`.
+        """
+        scope = self.state_manager.find_recordset_scope(name)
+        assert scope is not None
+        return scope.get_recordset(name)
+
+    def recordset_appender(self, name: str):
+        """
+        Return the bound append of the recordset `name`.
+        append_recordset re-finds the recordset's scope on every call;
+        scan loops should resolve the recordset once, via this, and
+        invoke the returned callable per record.
+        """
+        return self.get_recordset(name).append
+
     def append_grouped_recordset(
         self, name: str, group_key: Tuple, record: Union[SimpleRecord, ScopedRecord]
     ):
@@ -1445,10 +1867,12 @@ class VirtualMachine(Visitor):
         self.state_manager.drop_recordset(name)
 
     def recordset_iter(self, name: str) -> Iterable:
-        """Return an iterator over recordset
-        NOTE: The iterator will be consumed after one iteration
+        """Return an iterable over recordset.
+        NOTE: this returns the recordset's backing list- it supports
+        repeated iteration, unlike a one-shot iterator, and avoids the
+        per-call scope search; callers must not mutate it.
         """
-        return self.state_manager.recordset_iter(name)
+        return self.get_recordset(name)
 
     def grouped_recordset_iter(self, name: str) -> List[GroupedRecord]:
         """
@@ -3,6 +3,8 @@ This is a collection of simple end-to-end tests. These should
 validate the correctness of any interaction loop that the user
 can initiate.
 """
+import random
+
 import pytest
 
 from .context import LearnDB
@@ -208,6 +210,23 @@ def test_select_equality_compound_condition():
         keys.append(record.get("cola"))
     assert keys == [2, 3]
 
+    # multi-predicate AND; evaluation short-circuits on the first false
+    # predicate, which must not change which rows match
+    db.handle_input("select cola from foo where colB = 4 AND colc = 6 AND cold = 8")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [2]
+
+    # multi-clause OR; evaluation stops at the first true and_clause
+    db.handle_input("select cola from foo where cola = 1 OR colc = 6 OR cold = 8")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [1, 2, 3, 4]
+
 
 def test_select_equality_with_alias():
     """
@@ -419,6 +438,40 @@ def test_left_join():
         assert expected_key in keys
 
 
+def test_full_outer_join():
+    """
+    test full-outer join, where both sides have unmatched rows-
+    unmatched rows from each side must appear null-padded on the other
+    :return:
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.nuke_dbfile()
+
+    # create table
+    db.handle_input("create table foo ( cola integer primary key, colb integer, colc integer)")
+    db.handle_input("create table bar ( colx integer primary key, coly integer, colz integer)")
+    # insert into table; foo.cola = 1 and bar.colx = 103 have no match
+    db.handle_input("insert into foo (cola, colb, colc) values (1, 2, 3)")
+    db.handle_input("insert into foo (cola, colb, colc) values (2, 4, 6)")
+    db.handle_input("insert into foo (cola, colb, colc) values (3, 10, 8)")
+    db.handle_input("insert into bar (colx, coly, colz) values (101, 10, 80)")
+    db.handle_input("insert into bar (colx, coly, colz) values (102, 4, 90)")
+    db.handle_input("insert into bar (colx, coly, colz) values (103, 7, 70)")
+    # select
+    db.handle_input("select f.cola, b.colx from foo f full join bar b on f.colb = b.coly")
+
+    pairs = []
+
+    assert db.get_pipe().has_msgs()
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        pairs.append((record.get("f.cola"), record.get("b.colx")))
+    # create a set, because we can't sort tuples of ints and None
+    expected_pairs = {(1, None), (2, 102), (3, 101), (None, 103)}
+    assert set(pairs) == expected_pairs
+    assert len(pairs) == len(expected_pairs)
+
+
 def test_cross_join():
     """
     test left-outer join
@@ -563,6 +616,43 @@ def test_delete_inequality():
     assert not pipe.has_msgs(), "expected no rows"
 
 
+def test_delete_range_spanning_multiple_leaves():
+    """
+    test a bulk range delete on a table large enough that the tree has
+    split internal nodes. Regression test: the batched delete path
+    (Tree.delete_keys) must issue deletes in ascending key order-
+    descending order drives the delete-rebalance logic through node
+    shapes it cannot handle, and the delete aborts.
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.nuke_dbfile()
+
+    # create table
+    db.handle_input("create table big ( pk integer primary key, v integer, t text)")
+    # insert in a fixed shuffled order, so the tree grows through splits
+    keys = list(range(1, 81))
+    random.Random(1).shuffle(keys)
+    for key in keys:
+        resp = db.handle_input(f"insert into big (pk, v, t) values ({key}, {2 * key}, 'row{key}')")
+        assert resp.success, f"insert of {key} failed with {resp.error_message}"
+
+    # delete a range of keys spanning multiple leaves
+    resp = db.handle_input("delete from big where pk > 60")
+    assert resp.success, f"delete failed with {resp.error_message}"
+
+    # verify data
+    db.handle_input("select pk from big")
+    pipe = db.get_pipe()
+    assert pipe.has_msgs(), "expected rows"
+
+    actual_keys = []
+    while pipe.has_msgs():
+        record = pipe.read()
+        actual_keys.append(record.get("pk"))
+
+    assert sorted(actual_keys) == list(range(1, 61))
+
+
 def test_update():
     """
     test update statement